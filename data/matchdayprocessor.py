@@ -5,13 +5,39 @@ This module provides functionality to convert Fantacalcio Excel files to CSV for
 and extract player data for use in the simulator.
 """
 
+import argparse
+import csv
+import numpy as np
+import openpyxl
 import pandas as pd
 import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Union
 from send2trash import send2trash
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # optional native reader, installed with the "excel" extra
+    CalamineWorkbook = None
+
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:  # optional multi-threaded CSV reader, installed with the "excel" extra
+    pyarrow = None
+
+
+PLAYER_COLUMNS = ['Team', 'Cod', 'Role', 'Name', 'Rating', 'Gf', 'Gs',
+                  'Rp', 'Rs', 'Rf', 'Au', 'Amm', 'Esp', 'Ass']
+PLAYER_KEY_COLUMNS = PLAYER_COLUMNS[:4]
+
+_FOOTER_RE = re.compile(r'Voti Fantacalcio|www\.fantacalcio\.it|QUESTO FILE|USO PERSONALE')
+# Giornata_1.xlsx, giornata1.xlsx, matchday1.xlsx; otherwise the first number in the name
+_MATCHDAY_RE = re.compile(r'(?:giornata_?|matchday)(\d+)', re.IGNORECASE)
+_NUMBER_RE = re.compile(r'(\d+)')
+
 
 class DataProcessorError(Exception):
     """Base exception for data processor errors."""
@@ -70,15 +96,14 @@ class FantacalcioDataProcessor:
         
         try:
             self.logger.info(f"Processing Excel file: {excel_path.name}")
-            df = pd.read_excel(excel_path, sheet_name=0, header=None)
+            df = self._read_sheet(excel_path)
             
-            players_data = self._extract_player_data(df)
+            players = self._extract_player_data(df)
+            player_count = len(players['Cod'])
             
-            if not players_data:
+            if not player_count:
                 raise FileProcessingError("No player data found in the Excel file")
             
-            players_df = pd.DataFrame(players_data)
-            
             if output_csv_path is None:
                 matchday_num = self.extract_matchday_number(excel_path.name)
                 if matchday_num:
@@ -88,9 +113,13 @@ class FantacalcioDataProcessor:
             else:
                 output_csv_path = Path(output_csv_path)
 
-            players_df.to_csv(output_csv_path, index=False, encoding='utf-8')
+            # Rows are written straight from the column arrays, without a DataFrame round-trip
+            with open(output_csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(PLAYER_COLUMNS)
+                writer.writerows(zip(*(players[column] for column in PLAYER_COLUMNS)))
             self.logger.info(f"CSV file created: {output_csv_path.name}")
-            self.logger.info(f"Processed {len(players_data)} player records")
+            self.logger.info(f"Processed {player_count} player records")
             
             if delete_excel:
                 try:
@@ -105,102 +134,109 @@ class FantacalcioDataProcessor:
             self.logger.error(f"Error processing Excel file: {str(e)}")
             raise FileProcessingError(f"Failed to process Excel file: {str(e)}")
     
-    def _extract_player_data(self, df: pd.DataFrame) -> List[Dict]:
+    def _read_sheet(self, excel_path: Path) -> pd.DataFrame:
         """
-        Extract player data from the Excel DataFrame.
+        Read the first worksheet of an Excel file as a headerless DataFrame.
+        
+        When python-calamine is installed the sheet is parsed by its native
+        reader; otherwise .xlsx files are streamed with openpyxl in read-only
+        mode. Both skip the per-cell conversion layer of pd.read_excel, which
+        is only used for legacy .xls files without calamine.
         
         Args:
-            df: Pandas DataFrame from the Excel file
+            excel_path: Path to the Excel file
             
         Returns:
-            List of player record dictionaries
+            DataFrame with one row per sheet row and positional column labels
         """
-        players_data = []
-        current_team = None
+        if CalamineWorkbook is not None:
+            rows = CalamineWorkbook.from_path(str(excel_path)).get_sheet_by_index(0).to_python()
+            # Calamine returns every number as float and empty cells as ''; convert
+            # them to int and None like openpyxl
+            return pd.DataFrame([[int(cell) if isinstance(cell, float) and cell.is_integer()
+                                  else None if cell == '' else cell
+                                  for cell in row] for row in rows])
+        
+        if excel_path.suffix.lower() == '.xls':
+            return pd.read_excel(excel_path, sheet_name=0, header=None)
+        
+        wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+        try:
+            rows = list(wb.worksheets[0].iter_rows(values_only=True))
+        finally:
+            wb.close()
         
-        for index, row in df.iterrows():
-            row_data = [cell if pd.notna(cell) else None for cell in row.tolist()]
-            
-            if all(cell is None or cell == '' for cell in row_data):
-                continue
-            
-            if self._is_header_or_footer_row(row_data):
-                continue
-            
-            if self._is_column_header_row(row_data):
-                continue
-            
-            if self._is_team_name_row(row_data):
-                current_team = row_data[0]
-                self.logger.debug(f"Found team: {current_team}")
-                continue
+        return pd.DataFrame(rows)
+    
+    def _extract_player_data(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Extract player data from the Excel DataFrame.
+        
+        Rows are classified with boolean masks over whole columns instead of
+        per-row predicates; the team of each player row is forward-filled
+        from the closest team name row above it.
+        
+        Args:
+            df: Pandas DataFrame from the Excel file
             
-            if self._is_player_data_row(row_data):
-                player_record = self._create_player_record(row_data, current_team)
-                if player_record:
-                    players_data.append(player_record)
+        Returns:
+            Dictionary mapping each of PLAYER_COLUMNS to an array with one
+            value per player (missing values are None)
+        """
+        df = df.reset_index(drop=True)
+        df.columns = range(df.shape[1])
+        
+        if df.shape[1] < 4:
+            return {column: np.empty(0, dtype=object) for column in PLAYER_COLUMNS}
+        
+        empty = df.isna() | (df == '')
+        
+        # The type of the first cell drives every classifier, so it is computed once.
+        # Player rows (numeric first cell) are the bulk of the sheet and only need type
+        # checks; the string and regex checks run on the remaining candidates only
+        first_cell_type = df[0].map(type)
+        first_is_num = first_cell_type.isin([int, float]) & ~empty[0]
+        first_is_str = first_cell_type.isin([str]) & ~empty[0]
+        
+        player_mask = self._player_data_mask(df, first_is_num)
+        team_mask = self._team_name_mask(first_is_str, empty)
+        team_mask &= ~self._header_or_footer_mask(df[0], team_mask)
+        
+        team_names = df[0].where(team_mask)
+        self.logger.debug(f"Found teams: {', '.join(map(str, team_names.dropna()))}")
+        
+        # Assemble the output column by column from the sheet columns (Cod is column 0)
+        players = df.loc[player_mask]
+        columns = {
+            'Team': team_names.ffill()[player_mask].to_numpy(dtype=object, na_value=None),
+            'Cod': players[0].astype(int).to_numpy(),
+        }
+        for position, name in enumerate(PLAYER_COLUMNS[2:], start=1):
+            if position < players.shape[1]:
+                columns[name] = players[position].to_numpy(dtype=object, na_value=None)
+            else:
+                columns[name] = np.full(len(players), None, dtype=object)
         
-        return players_data
-    
-    def _is_header_or_footer_row(self, row_data: List) -> bool:
-        """Check if row contains header or footer information."""
-        if not row_data or not row_data[0]:
-            return False
-        
-        text = str(row_data[0])
-        keywords = [
-            'Voti Fantacalcio', 'www.fantacalcio.it', 
-            'QUESTO FILE', 'USO PERSONALE'
-        ]
-        return any(keyword in text for keyword in keywords)
+        return columns
     
-    def _is_column_header_row(self, row_data: List) -> bool:
-        """Check if row contains column headers."""
-        return (len(row_data) >= 3 and 
-                row_data[0] == 'Cod.' and 
-                row_data[1] == 'Ruolo' and 
-                row_data[2] == 'Nome')
+    def _header_or_footer_mask(self, col0: pd.Series, candidates: pd.Series) -> pd.Series:
+        """Flag candidate rows whose first cell contains header or footer information."""
+        mask = candidates.copy()
+        mask[mask] = col0[mask].astype(str).str.contains(_FOOTER_RE)
+        return mask
     
-    def _is_team_name_row(self, row_data: List) -> bool:
-        """Check if row contains a team name."""
-        return (len(row_data) >= 1 and 
-                row_data[0] and 
-                all(cell is None or cell == '' for cell in row_data[1:]) and
-                not self._is_header_or_footer_row(row_data))
+    def _team_name_mask(self, col0_is_str: pd.Series, empty: pd.DataFrame) -> pd.Series:
+        """Flag rows with a string in the first cell and nothing else."""
+        mask = col0_is_str.copy()
+        mask[mask] = empty.loc[mask].iloc[:, 1:].all(axis=1)
+        return mask
     
-    def _is_player_data_row(self, row_data: List) -> bool:
-        """Check if row contains player data."""
-        return (len(row_data) >= 4 and 
-                row_data[0] is not None and 
-                isinstance(row_data[0], (int, float)) and 
-                row_data[1] is not None and 
-                isinstance(row_data[1], str) and 
-                row_data[1] != "ALL" and  # Exclude coaches
-                row_data[2] is not None and 
-                isinstance(row_data[2], str))
-    
-    def _create_player_record(self, row_data: List, team: str) -> Optional[Dict]:
-        """Create a player record dictionary from row data."""
-        try:
-            return {
-                'Team': team,
-                'Cod': int(row_data[0]),
-                'Role': row_data[1],
-                'Name': row_data[2],
-                'Rating': row_data[3] if len(row_data) > 3 else None,
-                'Gf': row_data[4] if len(row_data) > 4 else None,
-                'Gs': row_data[5] if len(row_data) > 5 else None,
-                'Rp': row_data[6] if len(row_data) > 6 else None,
-                'Rs': row_data[7] if len(row_data) > 7 else None,
-                'Rf': row_data[8] if len(row_data) > 8 else None,
-                'Au': row_data[9] if len(row_data) > 9 else None,
-                'Amm': row_data[10] if len(row_data) > 10 else None,
-                'Esp': row_data[11] if len(row_data) > 11 else None,
-                'Ass': row_data[12] if len(row_data) > 12 else None
-            }
-        except (ValueError, IndexError) as e:
-            self.logger.warning(f"Could not create player record from row: {e}")
-            return None
+    def _player_data_mask(self, df: pd.DataFrame, col0_is_num: pd.Series) -> pd.Series:
+        """Flag rows containing player data."""
+        return (col0_is_num &
+                df[1].map(lambda cell: isinstance(cell, str)) &
+                (df[1] != "ALL") &  # Exclude coaches
+                df[2].map(lambda cell: isinstance(cell, str)))
     
     def extract_matchday_number(self, filename: str) -> Optional[int]:
         """
@@ -218,30 +254,30 @@ class FantacalcioDataProcessor:
         Returns:
             Matchday number or None if not found
         """
-        patterns = [
-            r'Giornata_(\d+)',  # Voti_Fantacalcio_Stagione_2024_25_Giornata_1.xlsx
-            r'giornata(\d+)',   # giornata1.xlsx
-            r'matchday(\d+)',   # matchday1.xlsx
-            r'(\d+)'           # fallback: any number in filename
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, filename, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
-        
-        return None
+        match = _MATCHDAY_RE.search(filename) or _NUMBER_RE.search(filename)
+        return int(match.group(1)) if match else None
     
     def batch_process_excel_files(self, input_directory: Union[str, Path], 
                                  output_directory: Optional[Union[str, Path]] = None,
-                                 delete_excel: bool = False) -> List[str]:
+                                 delete_excel: bool = False,
+                                 max_workers: Optional[int] = None) -> List[str]:
         """
         Process multiple Excel files in a directory and standardize player lists.
         
+        Files are converted in parallel worker processes; the standardization
+        pass runs afterwards in the calling process since it needs every file.
+        With a single file or max_workers=1 the conversion runs in the calling
+        process instead.
+        
+        Worker processes re-import the calling script under the "spawn" start
+        method (the default on Windows and macOS), so scripts calling this
+        method must guard their entry point with if __name__ == "__main__".
+        
         Args:
             input_directory: Directory containing Excel files
             output_directory: Directory for output CSV files (optional)
             delete_excel: Whether to delete original Excel files
+            max_workers: Number of worker processes (default: number of CPUs, 1 converts sequentially)
             
         Returns:
             List of paths to created CSV files
@@ -267,22 +303,42 @@ class FantacalcioDataProcessor:
         processed_files = []
         errors = []
         
-        temp_csv_files = []
+        output_files = {}
         for excel_file in excel_files:
-            try:
-                matchday_num = self.extract_matchday_number(excel_file.name)
-                if matchday_num:
-                    output_file = output_path / f"matchday{matchday_num}.csv"
-                else:
-                    output_file = output_path / excel_file.with_suffix('.csv').name
-                
-                csv_path = self.excel_to_csv(excel_file, output_file, delete_excel)
-                temp_csv_files.append(csv_path)
+            matchday_num = self.extract_matchday_number(excel_file.name)
+            if matchday_num:
+                output_files[excel_file] = output_path / f"matchday{matchday_num}.csv"
+            else:
+                output_files[excel_file] = output_path / excel_file.with_suffix('.csv').name
+        
+        temp_csv_files = []
+        if max_workers == 1 or len(excel_files) == 1:
+            # Not worth a process pool, and safe for scripts without a __main__ guard
+            for excel_file, output_file in output_files.items():
+                try:
+                    temp_csv_files.append(self.excel_to_csv(excel_file, output_file, delete_excel))
+                except Exception as e:
+                    error_msg = f"Failed to process {excel_file.name}: {str(e)}"
+                    self.logger.error(error_msg)
+                    errors.append(error_msg)
+        else:
+            log_level = logging.getLevelName(self.logger.level)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    excel_file: executor.submit(
+                        _convert_excel_file, str(excel_file), str(output_file), delete_excel, log_level
+                    )
+                    for excel_file, output_file in output_files.items()
+                }
                 
-            except Exception as e:
-                error_msg = f"Failed to process {excel_file.name}: {str(e)}"
-                self.logger.error(error_msg)
-                errors.append(error_msg)
+                # Collect in submission order so the CSV list is deterministic
+                for excel_file, future in futures.items():
+                    try:
+                        temp_csv_files.append(future.result())
+                    except Exception as e:
+                        error_msg = f"Failed to process {excel_file.name}: {str(e)}"
+                        self.logger.error(error_msg)
+                        errors.append(error_msg)
         
         # Second pass: standardize player lists across all matchdays
         if temp_csv_files:
@@ -324,71 +380,53 @@ class FantacalcioDataProcessor:
         
         self.logger.info(f"Collecting unique players from {len(csv_files)} CSV files...")
         
-        # Step 1: Collect all unique players across all matchdays
-        all_players = {}  # key: (Team, Cod, Role, Name), value: player record template
-        
+        # Step 1: Read each matchday once and collect all unique (Team, Cod, Role, Name) keys
+        frames = {}
         for csv_file in csv_files:
             try:
-                df = pd.read_csv(csv_file)
-                for _, row in df.iterrows():
-                    player_key = (row['Team'], row['Cod'], row['Role'], row['Name'])
-                    if player_key not in all_players:
-                        # Store player info without ratings/bonuses for template
-                        all_players[player_key] = {
-                            'Team': row['Team'],
-                            'Cod': row['Cod'],
-                            'Role': row['Role'],
-                            'Name': row['Name']
-                        }
+                frames[csv_file] = self._read_matchday_csv(csv_file)
             except Exception as e:
                 self.logger.error(f"Error reading {csv_file} for player collection: {str(e)}")
                 continue
         
+        if not frames:
+            return list(csv_files)
+        
+        all_players = pd.concat([df[PLAYER_KEY_COLUMNS] for df in frames.values()], ignore_index=True)
+        all_players = all_players.drop_duplicates(ignore_index=True)
+        
         self.logger.info(f"Found {len(all_players)} unique players across all matchdays")
         
         # Step 2: Standardize each CSV file
         standardized_files = []
         
         for csv_file in csv_files:
+            if csv_file not in frames:
+                standardized_files.append(csv_file)  # Unreadable, leave it as it is
+                continue
+            
             try:
-                df = pd.read_csv(csv_file)
-                existing_players = set()
-                
-                # Track which players are already in this matchday
-                for _, row in df.iterrows():
-                    player_key = (row['Team'], row['Cod'], row['Role'], row['Name'])
-                    existing_players.add(player_key)
+                df = frames[csv_file]
                 
-                # Add missing players with zero values
-                missing_players = []
-                for player_key, player_template in all_players.items():
-                    if player_key not in existing_players:
-                        missing_record = player_template.copy()
-                        # Set all numeric fields to 0
-                        missing_record.update({
-                            'Rating': 0,
-                            'Gf': 0,
-                            'Gs': 0,
-                            'Rp': 0,
-                            'Rs': 0,
-                            'Rf': 0,
-                            'Au': 0,
-                            'Amm': 0,
-                            'Esp': 0,
-                            'Ass': 0
-                        })
-                        missing_players.append(missing_record)
+                # Left join on the global key set; only the players missing from this
+                # matchday get zero values, blank cells of the others stay blank
+                merged = all_players.merge(df, on=PLAYER_KEY_COLUMNS, how='left', indicator=True)
+                missing = merged.pop('_merge') == 'left_only'
+                stat_columns = [col for col in df.columns if col not in PLAYER_KEY_COLUMNS]
+                merged[stat_columns] = (merged[stat_columns].where(~missing, 0, axis=0)
+                                        .astype(df.dtypes[stat_columns].to_dict()))
                 
-                if missing_players:
-                    self.logger.debug(f"Adding {len(missing_players)} missing players to {Path(csv_file).name}")
-                    missing_df = pd.DataFrame(missing_players)
-                    df = pd.concat([df, missing_df], ignore_index=True)
+                missing_count = int(missing.sum())
+                if missing_count:
+                    self.logger.debug(f"Adding {missing_count} missing players to {Path(csv_file).name}")
                 
-                # Sort by Team, then Role, then Name for consistency
-                df = df.sort_values(['Team', 'Role', 'Name'])
+                # Sort by Team, then Role, then Name for consistency; Team and Role are
+                # few distinct values, so as categoricals they sort on integer codes
+                merged = merged.astype({'Team': 'category', 'Role': 'category'})
+                merged = merged.sort_values(['Team', 'Role', 'Name'])
                 
                 # Save the standardized file
-                df.to_csv(csv_file, index=False, encoding='utf-8')
+                merged.to_csv(csv_file, index=False, encoding='utf-8')
                 standardized_files.append(csv_file)
                 
             except Exception as e:
@@ -397,6 +435,34 @@ class FantacalcioDataProcessor:
         
         return standardized_files
     
+    def _read_matchday_csv(self, csv_file: Union[str, Path]) -> pd.DataFrame:
+        """
+        Read a matchday CSV file with Rating kept as text.
+        
+        Rating is declared as text so files without "6*"-style ratings are not
+        inferred as float and rewritten as "6.0". When pyarrow is installed the
+        file is parsed by its multi-threaded reader, otherwise by pd.read_csv.
+        
+        Args:
+            csv_file: Path to the CSV file
+            
+        Returns:
+            DataFrame with the same columns and dtypes pd.read_csv gives
+        """
+        if pyarrow is None:
+            return pd.read_csv(csv_file, dtype={'Rating': str})
+        
+        convert_options = pyarrow.csv.ConvertOptions(
+            column_types={'Rating': pyarrow.string()},
+            strings_can_be_null=True
+        )
+        with pyarrow.memory_map(str(csv_file)) as source:
+            table = pyarrow.csv.read_csv(source, convert_options=convert_options)
+        
+        # pandas reads a column with no values as float, pyarrow as a null column
+        null_columns = [field.name for field in table.schema if pyarrow.types.is_null(field.type)]
+        return table.to_pandas().astype({column: float for column in null_columns})
+    
     def validate_csv_data(self, csv_file_path: Union[str, Path]) -> Dict:
         """
         Validate the structure and content of a processed CSV file.
@@ -440,6 +506,18 @@ class FantacalcioDataProcessor:
         except Exception as e:
             return {'valid': False, 'error': f'Error validating CSV: {str(e)}'}
 
+def _convert_excel_file(excel_file_path: str, output_csv_path: str,
+                        delete_excel: bool, log_level: str) -> str:
+    """
+    Convert a single Excel file in a worker process.
+    
+    Processors hold a logger and are not shipped to workers, so each call
+    builds its own instance.
+    """
+    processor = FantacalcioDataProcessor(log_level)
+    return processor.excel_to_csv(excel_file_path, output_csv_path, delete_excel)
+
+
 def process_excel_file(excel_file_path: Union[str, Path], 
                       output_csv_path: Optional[Union[str, Path]] = None,
                       delete_excel: bool = False) -> str:
@@ -460,22 +538,44 @@ def process_excel_file(excel_file_path: Union[str, Path],
 
 def batch_process_directory(input_directory: Union[str, Path],
                           output_directory: Optional[Union[str, Path]] = None,
-                          delete_excel: bool = False) -> List[str]:
+                          delete_excel: bool = False,
+                          max_workers: Optional[int] = None,
+                          log_level: str = "INFO") -> List[str]:
     """
     Quick function to batch process Excel files in a directory.
     
+    Conversions run in worker processes, so under the "spawn" start method
+    (Windows, macOS) the calling script needs an if __name__ == "__main__"
+    guard; pass max_workers=1 to convert in the calling process instead.
+    
     Args:
         input_directory: Directory with Excel files
         output_directory: Output directory (optional)
         delete_excel: Whether to delete original files
+        max_workers: Number of worker processes (default: number of CPUs, 1 converts sequentially)
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         
     Returns:
         List of created CSV file paths
     """
-    processor = FantacalcioDataProcessor()
-    return processor.batch_process_excel_files(input_directory, output_directory, delete_excel)
+    processor = FantacalcioDataProcessor(log_level)
+    return processor.batch_process_excel_files(input_directory, output_directory, delete_excel, max_workers)
 
 if __name__ == "__main__":
 
-    # Example usage: process all Excel files in "data/2021-22" and delete originals
-    batch_process_directory("data/2021-22", delete_excel=True)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Convert Fantacalcio.it matchday Excel files to CSV.")
+    parser.add_argument("input_directory", nargs="?", default="data/2021-22",
+                        help="Directory with Excel files (default: data/2021-22)")
+    parser.add_argument("-o", "--output-directory", help="Directory for the CSV files (default: input directory)")
+    parser.add_argument("--keep-excel", action="store_true", help="Keep the original Excel files")
+    parser.add_argument("-j", "--workers", type=int, help="Number of worker processes (default: number of CPUs)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only log warnings and errors")
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be a positive integer")
+
+    # By default, process all Excel files in "data/2021-22" and delete originals
+    batch_process_directory(args.input_directory, args.output_directory,
+                            delete_excel=not args.keep_excel,
+                            max_workers=args.workers,
+                            log_level="WARNING" if args.quiet else "INFO")
\ No newline at end of file
@@ -23,6 +23,7 @@ from .team import Team
 from .player import Player
 from .role import Role
 from .playerstats import PlayerStats
+from .matchdaytable import MatchdayTable
 
 __version__ = "0.1.2"
 __author__ = "Riccardo Samaritan"
@@ -43,5 +44,6 @@ __all__ = [
     "Team",
     "Player", 
     "Role",
-    "PlayerStats"
+    "PlayerStats",
+    "MatchdayTable"
 ]
\ No newline at end of file
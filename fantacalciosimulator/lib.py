@@ -2,7 +2,7 @@
 Fantacalcio Simulator Library - Simplified API
 """
 
-from .loader import setup_complete_teams, load_teams_from_csv, load_teams_from_dataframe, populate_teams_with_players, load_all_matchday_stats
+from .loader import setup_complete_teams
 from .probabilisticseason import ProbabilisticSeason
 from typing import List, Dict, Optional
 import logging
@@ -30,7 +30,7 @@ class FantacalcioSimulator:
     Main class for interacting with the Fantacalcio simulator.
     """
 
-    def __init__(self, season_year: str, teams_file: Optional[str] = None, data_dir: str = "data", log_level: str = "INFO", teams_data: Optional[List] = None, defense_modifier: bool = True):
+    def __init__(self, season_year: str, teams_file: Optional[str] = None, data_dir: str = "data", log_level: str = "INFO", teams_data: Optional[List] = None, defense_modifier: bool = True, use_fast_io: bool = False):
         """
         Initialize the simulator.
         
@@ -41,6 +41,7 @@ class FantacalcioSimulator:
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
             teams_data: Pre-loaded teams data (alternative to teams_file)
             defense_modifier: Whether to apply defense modifier bonus (default: True)
+            use_fast_io: Parse matchday CSVs with the pyarrow reader (requires pyarrow, default: False)
         """
         self._setup_logging(log_level)
         
@@ -63,6 +64,7 @@ class FantacalcioSimulator:
         self.teams_file = teams_file
         self.teams = teams_data
         self.defense_modifier = defense_modifier
+        self.use_fast_io = use_fast_io
         self.season = None
         self._cached_teams_info = None
         
@@ -122,12 +124,10 @@ class FantacalcioSimulator:
             teams_path = Path(self.teams_file)
             if teams_path.suffix.lower() == '.csv':
                 self.logger.info("Detected CSV format, loading teams from CSV...")
-                teams = load_teams_from_csv(self.teams_file, self.data_dir)
-                teams = populate_teams_with_players(teams, self.data_dir)
-                self.teams = load_all_matchday_stats(teams, self.data_dir)
+                self.teams = setup_complete_teams(self.teams_file, self.data_dir, self.use_fast_io)
             elif teams_path.suffix.lower() == '.json':
                 self.logger.info("Detected JSON format, loading teams from JSON...")
-                self.teams = setup_complete_teams(self.teams_file, self.data_dir)
+                self.teams = setup_complete_teams(self.teams_file, self.data_dir, self.use_fast_io)
             else:
                 raise InvalidTeamConfigError(f"Unsupported file format: {teams_path.suffix}. Supported formats: .csv, .json")
             
@@ -245,7 +245,7 @@ class FantacalcioSimulator:
     
     
     @classmethod
-    def from_dataframe(cls, season_year: str, teams_df: pd.DataFrame, data_dir: str = "data", log_level: str = "INFO", defense_modifier: bool = True) -> 'FantacalcioSimulator':
+    def from_dataframe(cls, season_year: str, teams_df: pd.DataFrame, data_dir: str = "data", log_level: str = "INFO", defense_modifier: bool = True, use_fast_io: bool = False) -> 'FantacalcioSimulator':
         """
         Create a FantacalcioSimulator from a pandas DataFrame containing teams configuration.
         
@@ -255,17 +255,16 @@ class FantacalcioSimulator:
             data_dir: Base directory containing season subdirectories
             log_level: Logging level
             defense_modifier: Whether to apply defense modifier bonus (default: True)
+            use_fast_io: Parse matchday CSVs with the pyarrow reader (requires pyarrow, default: False)
             
         Returns:
             FantacalcioSimulator instance
         """
         full_data_dir = str(Path(data_dir) / season_year)
         
-        teams = load_teams_from_dataframe(teams_df, full_data_dir)
-        teams = populate_teams_with_players(teams, full_data_dir)
-        teams = load_all_matchday_stats(teams, full_data_dir)
+        teams = setup_complete_teams(teams_df, full_data_dir, use_fast_io)
 
-        return cls(season_year=season_year, teams_file=None, data_dir=data_dir, log_level=log_level, teams_data=teams, defense_modifier=defense_modifier)
+        return cls(season_year=season_year, teams_file=None, data_dir=data_dir, log_level=log_level, teams_data=teams, defense_modifier=defense_modifier, use_fast_io=use_fast_io)
     
     def get_team_progression(self, team_name: str) -> Optional[Dict]:
         """
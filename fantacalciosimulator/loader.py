@@ -1,16 +1,99 @@
-import json
+import os
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Union
 from pathlib import Path
 from .team import Team
 from .player import Player
+from .matchdaytable import MatchdayTable
+from .progressline import ProgressLine
 
-def create_name_to_code_mapping(csv_file: str) -> Dict[str, int]:
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:  # optional fast CSV reader, installed with the "fast" extra
+    pyarrow = None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # optional fast JSON parser, installed with the "fast" extra
+    from json import loads as json_loads
+
+STAT_COLUMNS = ['Gf', 'Gs', 'Rp', 'Rs', 'Rf', 'Au', 'Amm', 'Esp', 'Ass']
+MATCHDAY_COLUMNS = ['Team', 'Cod', 'Role', 'Name', 'Rating'] + STAT_COLUMNS
+
+def extract_matchday_num(path: Path) -> int:
+    """
+    Extract the matchday number from a matchday CSV path.
+    
+    Args:
+        path: Path to a matchdayN.csv file
+        
+    Returns:
+        Matchday number, or 0 if the file name has no valid number
+    """
+    try:
+        return int(path.stem.replace('matchday', ''))
+    except ValueError:
+        return 0
+
+def find_matchday_csv_files(data_dir: str = "data") -> List[Path]:
+    """
+    Find the matchday CSV files in a directory, ordered by matchday number.
+    
+    Args:
+        data_dir: Directory containing matchday CSV files
+        
+    Returns:
+        List of matchday CSV paths sorted by matchday number
+    """
+    csv_files = sorted(Path(data_dir).glob("matchday*.csv"), key=extract_matchday_num)
+    
+    if not csv_files:
+        raise FileNotFoundError(f"No CSV files found in {data_dir}")
+    
+    return csv_files
+
+def read_matchday_csv(csv_file: str, columns: List[str], use_fast_io: bool = False) -> pd.DataFrame:
+    """
+    Read the given columns of a matchday CSV file.
+    
+    Args:
+        csv_file: Path to CSV file
+        columns: Columns to read
+        use_fast_io: Parse with the multi-threaded pyarrow reader (requires pyarrow)
+        
+    Returns:
+        DataFrame with the requested columns
+    """
+    if not use_fast_io:
+        return pd.read_csv(csv_file, usecols=columns)
+    
+    if pyarrow is None:
+        raise ImportError("use_fast_io requires pyarrow, install it with: pip install \"fantacalciosimulator[fast]\"")
+    
+    # Fixed types keep "6*" ratings as text and stop an all-blank stat column
+    # from being read as a null column; empty cells become NaN as with pandas
+    column_types = {'Rating': pyarrow.string(), **{col: pyarrow.float64() for col in STAT_COLUMNS}}
+    convert_options = pyarrow.csv.ConvertOptions(
+        include_columns=columns,
+        column_types={col: col_type for col, col_type in column_types.items() if col in columns},
+        strings_can_be_null=True
+    )
+    
+    # The parser reads straight from the memory-mapped file, without copying it first
+    with pyarrow.memory_map(str(csv_file)) as source:
+        table = pyarrow.csv.read_csv(source, convert_options=convert_options)
+    return table.to_pandas()
+
+def create_name_to_code_mapping(csv_file: str, use_fast_io: bool = False) -> Dict[str, int]:
     """
     Create a mapping from player names to their codes.
     
     Args:
         csv_file: Path to CSV file
+        use_fast_io: Parse with the multi-threaded pyarrow reader (requires pyarrow)
         
     Returns:
         Dictionary mapping player names to their codes
@@ -18,23 +101,26 @@ def create_name_to_code_mapping(csv_file: str) -> Dict[str, int]:
     if not Path(csv_file).exists():
         raise FileNotFoundError(f"CSV file not found: {csv_file}")
     
-    df = pd.read_csv(csv_file)
-    name_to_code = {}
-    
-    for _, row in df.iterrows():
-        name = row['Name']
-        cod = int(row['Cod'])
-        name_to_code[name] = cod
-    
-    return name_to_code
+    return _name_to_code_from_frame(read_matchday_csv(csv_file, ['Name', 'Cod'], use_fast_io))
+
+def _name_to_code_from_frame(df: pd.DataFrame) -> Dict[str, int]:
+    """
+    Build the name to code mapping from a matchday DataFrame.
+    """
+    # Later rows win for repeated names, as with sequential dict assignment
+    return dict(zip(df['Name'].tolist(), df['Cod'].astype('int64').tolist()))
 
-def load_teams_from_json(json_file: str, data_dir: str = "data") -> List[Team]:
+def load_teams_from_json(json_file: str, data_dir: str = "data",
+                         name_to_code: Optional[Dict[str, int]] = None,
+                         use_fast_io: bool = False) -> List[Team]:
     """
     Load team configurations from JSON file.
 
     Args:
         json_file: Path to JSON file containing team configurations
         data_dir: Directory containing matchday CSV files to map names to codes
+        name_to_code: Already built name to code mapping; built from the first matchday CSV if omitted
+        use_fast_io: Parse the matchday CSV with the multi-threaded pyarrow reader (requires pyarrow)
         
     Returns:
         List of Team objects with player codes assigned
@@ -43,15 +129,11 @@ def load_teams_from_json(json_file: str, data_dir: str = "data") -> List[Team]:
     if not json_path.exists():
         raise FileNotFoundError(f"JSON file not found: {json_path}")
     
-    csv_files = list(Path(data_dir).glob("matchday*.csv"))
-    if not csv_files:
-        raise FileNotFoundError(f"No CSV files found in {data_dir}")
+    if name_to_code is None:
+        name_to_code = create_name_to_code_mapping(find_matchday_csv_files(data_dir)[0], use_fast_io)
     
-    first_csv = sorted(csv_files)[0]
-    name_to_code = create_name_to_code_mapping(first_csv)
-    
-    with open(json_path, 'r', encoding='utf-8') as f:
-        teams_config = json.load(f)
+    with open(json_path, 'rb') as f:
+        teams_config = json_loads(f.read())
     
     teams = []
     for team_config in teams_config:
@@ -65,7 +147,7 @@ def load_teams_from_json(json_file: str, data_dir: str = "data") -> List[Team]:
             for role_key in ['goalkeepers', 'defenders', 'midfielders', 'forwards']:
                 if role_key in team_config:
                     for player_info in team_config[role_key]:
-                        player_name = player_info.split(' (')[0].strip()
+                        player_name = player_info.partition(' (')[0].strip()
                         
                         if player_name in name_to_code:
                             player_codes.append(name_to_code[player_name])
@@ -77,7 +159,9 @@ def load_teams_from_json(json_file: str, data_dir: str = "data") -> List[Team]:
     
     return teams
 
-def load_teams_from_csv(csv_file: str, data_dir: str = "data") -> List[Team]:
+def load_teams_from_csv(csv_file: str, data_dir: str = "data",
+                        name_to_code: Optional[Dict[str, int]] = None,
+                        use_fast_io: bool = False) -> List[Team]:
     """
     Load team configurations from CSV file.
     
@@ -90,6 +174,8 @@ def load_teams_from_csv(csv_file: str, data_dir: str = "data") -> List[Team]:
     Args:
         csv_file: Path to CSV file containing team configurations
         data_dir: Directory containing matchday CSV files to map names to codes
+        name_to_code: Already built name to code mapping; built from the first matchday CSV if omitted
+        use_fast_io: Parse the matchday CSV with the multi-threaded pyarrow reader (requires pyarrow)
         
     Returns:
         List of Team objects with player codes assigned
@@ -105,34 +191,11 @@ def load_teams_from_csv(csv_file: str, data_dir: str = "data") -> List[Team]:
     if missing_columns:
         raise ValueError(f"Missing required columns in CSV: {missing_columns}")
 
-    matchday_csv_files = list(Path(data_dir).glob("matchday*.csv"))
-    if not matchday_csv_files:
-        raise FileNotFoundError(f"No matchday CSV files found in {data_dir}")
-    
-    first_csv = sorted(matchday_csv_files)[0]
-    name_to_code = create_name_to_code_mapping(str(first_csv))
-    
-    teams = []
-    for team_name, team_data in teams_df.groupby('team_name'):
-        player_codes = []
-        
-        for _, player_row in team_data.iterrows():
-            player_name = player_row['player_name']
-            role = player_row['role']
-            
-            player_name_clean = player_name.split(' (')[0].strip()
-            
-            if player_name_clean in name_to_code:
-                player_codes.append(name_to_code[player_name_clean])
-            else:
-                print(f"Warning: Player '{player_name_clean}' not found in CSV data")
-        
-        team = Team(name=team_name, player_codes=player_codes)
-        teams.append(team)
-    
-    return teams
+    return load_teams_from_dataframe(teams_df, data_dir, name_to_code, use_fast_io)
 
-def load_teams_from_dataframe(df: pd.DataFrame, data_dir: str = "data") -> List[Team]:
+def load_teams_from_dataframe(df: pd.DataFrame, data_dir: str = "data",
+                              name_to_code: Optional[Dict[str, int]] = None,
+                              use_fast_io: bool = False) -> List[Team]:
     """
     Load team configurations from pandas DataFrame.
     
@@ -147,6 +210,8 @@ def load_teams_from_dataframe(df: pd.DataFrame, data_dir: str = "data") -> List[
     Args:
         df: DataFrame containing team configurations
         data_dir: Directory containing matchday CSV files to map names to codes
+        name_to_code: Already built name to code mapping; built from the first matchday CSV if omitted
+        use_fast_io: Parse the matchday CSV with the multi-threaded pyarrow reader (requires pyarrow)
         
     Returns:
         List of Team objects with player codes assigned
@@ -156,12 +221,8 @@ def load_teams_from_dataframe(df: pd.DataFrame, data_dir: str = "data") -> List[
     if missing_columns:
         raise ValueError(f"Missing required columns in DataFrame: {missing_columns}")
  
-    matchday_csv_files = list(Path(data_dir).glob("matchday*.csv"))
-    if not matchday_csv_files:
-        raise FileNotFoundError(f"No matchday CSV files found in {data_dir}")
-    
-    first_csv = sorted(matchday_csv_files)[0]
-    name_to_code = create_name_to_code_mapping(str(first_csv))
+    if name_to_code is None:
+        name_to_code = create_name_to_code_mapping(find_matchday_csv_files(data_dir)[0], use_fast_io)
 
     teams = []
     for team_name, team_data in df.groupby('team_name'):
@@ -170,7 +231,7 @@ def load_teams_from_dataframe(df: pd.DataFrame, data_dir: str = "data") -> List[
         for _, player_row in team_data.iterrows():
             player_name = player_row['player_name']
             
-            player_name_clean = player_name.split(' (')[0].strip()
+            player_name_clean = player_name.partition(' (')[0].strip()
             
             if player_name_clean in name_to_code:
                 player_codes.append(name_to_code[player_name_clean])
@@ -182,61 +243,124 @@ def load_teams_from_dataframe(df: pd.DataFrame, data_dir: str = "data") -> List[
     
     return teams
 
-def load_player_data_from_matchday_csv(csv_file: str) -> Dict[int, Dict]:
+def calculate_fantavoto_column(df: pd.DataFrame) -> np.ndarray:
     """
-    Load player data from a matchday CSV file.
+    Calculate the fantavoto of every row of a matchday DataFrame at once.
+    
+    Applies the same bonus and malus as Player.calculate_fantavoto, using the
+    CSV role ('P') to detect goalkeepers.
+    
+    Args:
+        df: Matchday DataFrame with Rating, Role and stat columns (NaN stats already filled)
+        
+    Returns:
+        Array with the fantavoto of each row
+    """
+    rating = df['Rating'].to_numpy(dtype=object)
+    if not pd.api.types.is_numeric_dtype(df['Rating']):
+        # "6*" marks a rating without a real vote, which counts as 0
+        starred = np.char.find(rating.astype(str), '*') >= 0
+        rating = np.where(starred, 0, rating)
+    rating = rating.astype(float)
+    
+    gf, gs, rp, rs, rf, au, amm, esp, ass = (df[col].to_numpy(dtype=float) for col in STAT_COLUMNS)
+    fantavoto = rating + gf * 3 + ass + rs - rf * 3 - amm * 0.5 - esp - au * 2
+    
+    goalkeeper = (df['Role'] == 'P').to_numpy()
+    fantavoto = np.where(goalkeeper, fantavoto + (gs == 0) - gs + rp * 3, fantavoto)
+    
+    return np.where(rating != 0, np.round(fantavoto, 1), 0.0)
+
+def read_matchday_frame(csv_file: str, use_fast_io: bool = False) -> pd.DataFrame:
+    """
+    Read a matchday CSV file, with missing stats set to 0.
     
     Args:
         csv_file: Path to CSV file
+        use_fast_io: Parse with the multi-threaded pyarrow reader (requires pyarrow)
         
     Returns:
-        Dictionary mapping player codes to their data
+        DataFrame with the matchday columns
     """
     if not Path(csv_file).exists():
         raise FileNotFoundError(f"CSV file not found: {csv_file}")
     
-    df = pd.read_csv(csv_file)
-    players_data = {}
-    
-    for _, row in df.iterrows():
-        cod = int(row['Cod'])
-        players_data[cod] = {
-            'Team': row['Team'],
-            'Role': row['Role'],
-            'Name': row['Name'],
-            'Rating': row['Rating'],
-            'Gf': row['Gf'] if pd.notna(row['Gf']) else 0,
-            'Gs': row['Gs'] if pd.notna(row['Gs']) else 0,
-            'Rp': row['Rp'] if pd.notna(row['Rp']) else 0,
-            'Rs': row['Rs'] if pd.notna(row['Rs']) else 0,
-            'Rf': row['Rf'] if pd.notna(row['Rf']) else 0,
-            'Au': row['Au'] if pd.notna(row['Au']) else 0,
-            'Amm': row['Amm'] if pd.notna(row['Amm']) else 0,
-            'Esp': row['Esp'] if pd.notna(row['Esp']) else 0,
-            'Ass': row['Ass'] if pd.notna(row['Ass']) else 0
-        }
-    
-    return players_data
-
-def populate_teams_with_players(teams: List[Team], data_dir: str = "data") -> List[Team]:
+    df = read_matchday_csv(csv_file, MATCHDAY_COLUMNS, use_fast_io)
+    df[STAT_COLUMNS] = df[STAT_COLUMNS].fillna(0)
+    return df
+
+def read_matchday_frames(csv_files: List[Path], use_fast_io: bool = False) -> Dict[Path, pd.DataFrame]:
+    """
+    Read several matchday CSV files in parallel threads.
+    
+    Args:
+        csv_files: Paths to CSV files
+        use_fast_io: Parse with the multi-threaded pyarrow reader (requires pyarrow)
+        
+    Returns:
+        Dictionary mapping each path to its DataFrame, in the given order
+    """
+    # The C parser releases the GIL, so files are parsed in parallel threads
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        frames = executor.map(lambda csv_file: read_matchday_frame(csv_file, use_fast_io), csv_files)
+        return dict(zip(csv_files, frames))
+
+def _matchday_table_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Convert a matchday DataFrame to the MatchdayTable column arrays, including the fantavoto.
+    """
+    return dict(
+        cods=df['Cod'].to_numpy(dtype='int64'),
+        teams=df['Team'].to_numpy(dtype=object),
+        roles=df['Role'].to_numpy(dtype=object),
+        names=df['Name'].to_numpy(dtype=object),
+        ratings=df['Rating'].to_numpy(dtype=object),
+        fantavoto=calculate_fantavoto_column(df),
+        **{col.lower(): df[col].to_numpy(dtype=float) for col in STAT_COLUMNS}
+    )
+
+def load_matchday_table(csv_file: str, use_fast_io: bool = False) -> MatchdayTable:
+    """
+    Load player data from a matchday CSV file into a column-wise table.
+    
+    Args:
+        csv_file: Path to CSV file
+        use_fast_io: Parse with the multi-threaded pyarrow reader (requires pyarrow)
+        
+    Returns:
+        MatchdayTable with one array per column, including the precomputed fantavoto
+    """
+    return MatchdayTable(**_matchday_table_columns(read_matchday_frame(csv_file, use_fast_io)))
+
+def load_player_data_from_matchday_csv(csv_file: str, use_fast_io: bool = False) -> Dict[int, Dict]:
+    """
+    Load player data from a matchday CSV file.
+    
+    Args:
+        csv_file: Path to CSV file
+        use_fast_io: Parse with the multi-threaded pyarrow reader (requires pyarrow)
+        
+    Returns:
+        Dictionary mapping player codes to their data, including the precomputed Fantavoto
+    """
+    table = load_matchday_table(csv_file, use_fast_io)
+    return {cod: table.get_player_data(row) for cod, row in table.index.items()}
+
+def populate_teams_with_players(teams: List[Team], data_dir: str = "data",
+                                players_data: Optional[MatchdayTable] = None) -> List[Team]:
     """
     Populate teams with actual Player objects from CSV data.
     
     Args:
         teams: List of Team objects with player codes
         data_dir: Directory containing CSV files
+        players_data: Already parsed first matchday table; read from data_dir if omitted
         
     Returns:
         List of Team objects populated with Player objects
     """
-    data_path = Path(data_dir)
-    csv_files = list(data_path.glob("matchday*.csv"))
-    
-    if not csv_files:
-        raise FileNotFoundError(f"No CSV files found in {data_dir}")
-
-    first_csv = sorted(csv_files)[0]
-    players_data = load_player_data_from_matchday_csv(first_csv)
+    if players_data is None:
+        players_data = load_matchday_table(find_matchday_csv_files(data_dir)[0])
     
     role_mapping = {
         'P': 'G',
@@ -247,15 +371,16 @@ def populate_teams_with_players(teams: List[Team], data_dir: str = "data") -> Li
 
     for team in teams:
         for cod in team.player_codes:
-            if cod in players_data:
-                data = players_data[cod]
-                role = role_mapping.get(data['Role'], data['Role'])
+            row = players_data.index.get(cod)
+            if row is not None:
+                csv_role = players_data.roles[row]
+                role = role_mapping.get(csv_role, csv_role)
                 
                 player = Player(
                     cod=cod,
                     role=role,
-                    name=data['Name'],
-                    team=data['Team']
+                    name=players_data.names[row],
+                    team=players_data.teams[row]
                 )
                 
                 team.add_player(player)
@@ -270,54 +395,65 @@ def populate_teams_with_players(teams: List[Team], data_dir: str = "data") -> Li
     
     return teams
 
-def load_all_matchday_stats(teams: List[Team], data_dir: str = "data") -> List[Team]:
+def load_all_matchday_stats(teams: List[Team], data_dir: str = "data",
+                            csv_files: Optional[List[Path]] = None,
+                            frames: Optional[Dict[Path, pd.DataFrame]] = None,
+                            use_fast_io: bool = False) -> List[Team]:
     """
     Load statistics for all matchdays from CSV files and populate player stats.
     
     Args:
         teams: List of Team objects with Player objects already created
         data_dir: Directory containing CSV files
+        csv_files: Matchday CSV paths, in any order; found in data_dir if omitted
+        frames: Already read matchday frames by path; files not in it are read here
+        use_fast_io: Parse with the multi-threaded pyarrow reader (requires pyarrow)
         
     Returns:
         List of Team objects with complete player statistics
     """
-    data_path = Path(data_dir)
-    csv_files = list(data_path.glob("matchday*.csv"))
-    
-    if not csv_files:
-        raise FileNotFoundError(f"No CSV files found in {data_dir}")
-
-    def extract_matchday_num(path):
-        try:
-            name = path.stem
-            return int(name.replace('matchday', ''))
-        except ValueError:
-            return 0
-    
-    csv_files = sorted(csv_files, key=extract_matchday_num)
+    if csv_files is None:
+        csv_files = find_matchday_csv_files(data_dir)
 
     all_players = {}
     for team in teams:
         for player in team.players:
             all_players[player.cod] = player
 
-    for csv_file in csv_files:
-        matchday_num = extract_matchday_num(csv_file)
-        if matchday_num == 0:
-            continue
-        
-        print(f"Loading matchday {matchday_num} stats...")
-        matchday_data = load_player_data_from_matchday_csv(csv_file)
-        
-        for cod, data in matchday_data.items():
-            if cod in all_players:
-                all_players[cod].add_matchday_stats(matchday_num, data)
-                all_players[cod].add_matchday_fantavoto(matchday_num)
+    # Sorted by matchday number so each matchday is a contiguous slice of the season below
+    matchday_files = sorted((f for f in csv_files if extract_matchday_num(f) != 0), key=extract_matchday_num)
+    matchday_nums = [extract_matchday_num(f) for f in matchday_files]
+
+    frames = dict(frames or {})
+    frames.update(read_matchday_frames([f for f in matchday_files if f not in frames], use_fast_io))
+
+    if matchday_files:
+        # One pass over the whole season: keep only rostered players, then
+        # compute every fantavoto and column array at once
+        season = pd.concat([frames[f].assign(Matchday=num) for f, num in zip(matchday_files, matchday_nums)],
+                           ignore_index=True)
+        season = season[season['Cod'].isin(all_players.keys())]
+        columns = _matchday_table_columns(season)
+
+        # Rows stay in matchday order, so each matchday is a contiguous slice
+        matchdays = season['Matchday'].to_numpy()
+        starts = np.searchsorted(matchdays, matchday_nums, side='left')
+        stops = np.searchsorted(matchdays, matchday_nums, side='right')
+
+        progress = ProgressLine()
+        for matchday_num, start, stop in zip(matchday_nums, starts, stops):
+            progress.update(f"Loading matchday {matchday_num} stats...")
+            table = MatchdayTable(**{name: values[start:stop] for name, values in columns.items()})
+
+            for cod, row in table.index.items():
+                all_players[cod].add_matchday_row(matchday_num, table, row)
+        progress.finish()
     
     print(f"Loaded stats for {len(csv_files)} matchdays")
     return teams
 
-def setup_complete_teams(teams_source: Union[str, pd.DataFrame], data_dir: str = "data") -> List[Team]:
+def setup_complete_teams(teams_source: Union[str, pd.DataFrame], data_dir: str = "data",
+                         use_fast_io: bool = False) -> List[Team]:
     """
     Complete team setup pipeline supporting multiple input formats.
     
@@ -333,6 +469,7 @@ def setup_complete_teams(teams_source: Union[str, pd.DataFrame], data_dir: str =
     Args:
         teams_source: Path to teams file (JSON/CSV) or pandas DataFrame with team data
         data_dir: Directory containing matchday CSV files
+        use_fast_io: Parse matchday CSVs with the multi-threaded pyarrow reader (requires pyarrow)
         
     Returns:
         List of fully configured Team objects with all player statistics loaded
@@ -341,25 +478,34 @@ def setup_complete_teams(teams_source: Union[str, pd.DataFrame], data_dir: str =
         FileNotFoundError: If teams file or matchday data directory doesn't exist
         ValueError: If unsupported file format or invalid DataFrame structure
     """
-    if isinstance(teams_source, pd.DataFrame):
-        teams = load_teams_from_dataframe(teams_source, data_dir)
-
-    elif isinstance(teams_source, str):
+    if isinstance(teams_source, str):
         teams_path = Path(teams_source)
         if not teams_path.exists():
             raise FileNotFoundError(f"Teams file not found: {teams_source}")
-
-        if teams_path.suffix.lower() == '.csv':
-            teams = load_teams_from_csv(teams_source, data_dir)
-        elif teams_path.suffix.lower() == '.json':
-            teams = load_teams_from_json(teams_source, data_dir)
-        else:
+        if teams_path.suffix.lower() not in ('.csv', '.json'):
             raise ValueError(f"Unsupported file format: {teams_path.suffix}. Supported formats: .json, .csv")
-    
-    else:
+    elif not isinstance(teams_source, pd.DataFrame):
         raise ValueError("teams_source must be a file path (str) or pandas DataFrame")
 
-    teams = populate_teams_with_players(teams, data_dir)
-    teams = load_all_matchday_stats(teams, data_dir)
+    csv_files = find_matchday_csv_files(data_dir)
+    # Every file is read once, in one parallel pass: the first matchday maps
+    # names to codes, creates the players and provides their first stats
+    files_to_read = list(dict.fromkeys([csv_files[0]] + [f for f in csv_files if extract_matchday_num(f) != 0]))
+    frames = read_matchday_frames(files_to_read, use_fast_io)
+    first_frame = frames[csv_files[0]]
+    name_to_code = _name_to_code_from_frame(first_frame)
+
+    if isinstance(teams_source, pd.DataFrame):
+        teams = load_teams_from_dataframe(teams_source, data_dir, name_to_code)
+    elif teams_path.suffix.lower() == '.csv':
+        teams = load_teams_from_csv(teams_source, data_dir, name_to_code)
+    else:
+        teams = load_teams_from_json(teams_source, data_dir, name_to_code)
+
+    # Only rostered players are turned into table rows
+    all_codes = set().union(*(team.player_codes for team in teams))
+    first_matchday = MatchdayTable(**_matchday_table_columns(first_frame[first_frame['Cod'].isin(all_codes)]))
+    teams = populate_teams_with_players(teams, data_dir, first_matchday)
+    teams = load_all_matchday_stats(teams, data_dir, csv_files, frames, use_fast_io)
     
     return teams
\ No newline at end of file
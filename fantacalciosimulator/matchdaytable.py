@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+from typing import Dict
+import numpy as np
+from .playerstats import PlayerStats
+
+@dataclass
+class MatchdayTable:
+    """
+    This class stores the data of all players for a specific matchday, one array per column.
+    """
+    cods: np.ndarray
+    teams: np.ndarray
+    roles: np.ndarray
+    names: np.ndarray
+    ratings: np.ndarray     # Raw ratings, "6*" kept as text
+    gf: np.ndarray
+    gs: np.ndarray
+    rp: np.ndarray
+    rs: np.ndarray
+    rf: np.ndarray
+    au: np.ndarray
+    amm: np.ndarray
+    esp: np.ndarray
+    ass: np.ndarray
+    fantavoto: np.ndarray
+    index: Dict[int, int] = field(init=False, repr=False)  # Player code -> row
+
+    def __post_init__(self):
+        """
+        Build the code to row index. A code listed twice (player who changed club) keeps its last row.
+        """
+        self.index = dict(zip(self.cods.tolist(), range(len(self.cods))))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, cod: int) -> bool:
+        return cod in self.index
+
+    def get_player_stats(self, row: int) -> PlayerStats:
+        """Return the stats stored in a row"""
+        return PlayerStats(
+            rating=self.ratings[row],
+            gf=self.gf[row].item(),
+            gs=self.gs[row].item(),
+            rp=self.rp[row].item(),
+            rs=self.rs[row].item(),
+            rf=self.rf[row].item(),
+            au=self.au[row].item(),
+            amm=self.amm[row].item(),
+            esp=self.esp[row].item(),
+            ass=self.ass[row].item()
+        )
+
+    def get_player_data(self, row: int) -> Dict:
+        """Return a row as a dictionary keyed by the CSV column names"""
+        return {
+            'Team': self.teams[row],
+            'Role': self.roles[row],
+            'Name': self.names[row],
+            'Rating': self.ratings[row],
+            'Gf': self.gf[row].item(),
+            'Gs': self.gs[row].item(),
+            'Rp': self.rp[row].item(),
+            'Rs': self.rs[row].item(),
+            'Rf': self.rf[row].item(),
+            'Au': self.au[row].item(),
+            'Amm': self.amm[row].item(),
+            'Esp': self.esp[row].item(),
+            'Ass': self.ass[row].item(),
+            'Fantavoto': self.fantavoto[row].item()
+        }
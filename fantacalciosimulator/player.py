@@ -1,4 +1,5 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+from .matchdaytable import MatchdayTable
 from .playerstats import PlayerStats
 from .role import Role
 
@@ -6,12 +7,15 @@ class Player:
     """
     Class to represent a player in Fantacalcio.
     """
+    __slots__ = ('cod', 'role', 'name', 'real_team', 'matchday_stats', 'matchday_rows', 'matchday_fantavoto')
+    
     def __init__(self, cod: int, role: str, name: str, team: str):
         self.cod = cod
         self.role = Role(role)
         self.name = name
         self.real_team = team
         self.matchday_stats: Dict[int, PlayerStats] = {}
+        self.matchday_rows: Dict[int, Tuple[MatchdayTable, int]] = {}  # matchday -> (table, row)
         self.matchday_fantavoto: Dict[int, float] = {}
     
     def add_matchday_stats(self, matchday: int, stats: Dict):
@@ -31,6 +35,14 @@ class Player:
             ass=stats.get('Ass', 0)
         )
     
+    def add_matchday_row(self, matchday: int, table: MatchdayTable, row: int):
+        """
+        Add the statistics and fantavoto for a specific matchday from a row of a matchday table.
+        The stats stay in the table and are read back only when requested.
+        """
+        self.matchday_rows[matchday] = (table, row)
+        self.matchday_fantavoto[matchday] = table.fantavoto[row].item()
+    
     def add_matchday_fantavoto(self, matchday:int):
         """
         Add fantavoto for a specific matchday
@@ -39,7 +51,11 @@ class Player:
 
     def get_stats(self, matchday: int) -> Optional[PlayerStats]:
         """Return stats from a specific matchday"""
-        return self.matchday_stats.get(matchday)
+        stats = self.matchday_stats.get(matchday)
+        if stats is None and matchday in self.matchday_rows:
+            table, row = self.matchday_rows[matchday]
+            stats = table.get_player_stats(row)
+        return stats
     
     def calculate_fantavoto(self, matchday: int) -> float:
         """
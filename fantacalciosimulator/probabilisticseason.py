@@ -1,17 +1,27 @@
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+import numpy as np
 from .team import Team
+from .progressline import ProgressLine
 
 class ProbabilisticSeasonTable:
     """
     Class to manage the probabilistic season table for a team.
     """
+    __slots__ = ('team', 'total_points', 'matchday_scores', 'matchday_league_points', 'played_mask',
+                 'matchdays_played', 'total_fantasy_score', 'best_fantasy_score', 'worst_fantasy_score',
+                 'wins', 'draws', 'losses')
     
     def __init__(self, team: Team):
         self.team = team
         self.total_points = 0.0  
-        self.matchday_scores: Dict[int, float] = {}  # actual fantasy scores
-        self.matchday_league_points: Dict[int, float] = {}  # probabilistic league points
+        # Indexed by matchday number (1-38), slot 0 unused
+        self.matchday_scores = np.zeros(39)  # actual fantasy scores
+        self.matchday_league_points = np.zeros(39)  # probabilistic league points
+        self.played_mask = np.zeros(39, dtype=bool)  # matchdays with data
         self.matchdays_played = 0
+        self.total_fantasy_score = 0.0
+        self.best_fantasy_score: Optional[float] = None
+        self.worst_fantasy_score: Optional[float] = None
         self.wins = 0.0
         self.draws = 0.0
         self.losses = 0.0
@@ -21,22 +31,37 @@ class ProbabilisticSeasonTable:
         Add data for a specific matchday.
         
         Args:
-            matchday: The matchday number
+            matchday: The matchday number (1-38)
             fantasy_score: Actual fantasy score for the matchday
             league_points: Probabilistic league points earned
         """
-        if matchday not in self.matchday_scores:
-            self.matchdays_played += 1
+        replaced = self.played_mask[matchday]
         
         self.matchday_scores[matchday] = fantasy_score
         self.matchday_league_points[matchday] = league_points
-        self.total_points = sum(self.matchday_league_points.values())
+        self.played_mask[matchday] = True
+        
+        if replaced:
+            # Rare: a matchday processed twice, so rebuild the totals from scratch
+            scores = self.matchday_scores[self.played_mask].tolist()
+            self.total_points = sum(self.matchday_league_points[self.played_mask].tolist())
+            self.total_fantasy_score = sum(scores)
+            self.best_fantasy_score = max(scores)
+            self.worst_fantasy_score = min(scores)
+        else:
+            self.matchdays_played += 1
+            self.total_points += league_points
+            self.total_fantasy_score += fantasy_score
+            if self.best_fantasy_score is None or fantasy_score > self.best_fantasy_score:
+                self.best_fantasy_score = fantasy_score
+            if self.worst_fantasy_score is None or fantasy_score < self.worst_fantasy_score:
+                self.worst_fantasy_score = fantasy_score
     
     def get_stats(self) -> Dict:
         """
         Get team statistics.
         """
-        avg_fantasy_score = sum(self.matchday_scores.values()) / max(self.matchdays_played, 1)
+        avg_fantasy_score = self.total_fantasy_score / max(self.matchdays_played, 1)
         avg_league_points = self.total_points / max(self.matchdays_played, 1)
         
         return {
@@ -45,8 +70,8 @@ class ProbabilisticSeasonTable:
             'matchdays_played': self.matchdays_played,
             'average_fantasy_score': round(avg_fantasy_score, 1),
             'average_league_points': round(avg_league_points, 2),
-            'best_fantasy_score': max(self.matchday_scores.values()) if self.matchday_scores else 0.0,
-            'worst_fantasy_score': min(self.matchday_scores.values()) if self.matchday_scores else 0.0
+            'best_fantasy_score': self.best_fantasy_score if self.matchdays_played else 0.0,
+            'worst_fantasy_score': self.worst_fantasy_score if self.matchdays_played else 0.0
         }
 
 
@@ -110,13 +135,14 @@ class ProbabilisticSeason:
         else:
             return 'draw', goals_a, goals_b
     
-    def process_matchday(self, matchday: int) -> Dict[str, Dict]:
+    def process_matchday(self, matchday: int, team_scores: Optional[Dict[str, float]] = None) -> Dict[str, Dict]:
         """
         Process a matchday by calculating all possible pairings and determining
         probabilistic points for each team.
         
         Args:
             matchday: Matchday number (1-38)
+            team_scores: Already calculated team scores for this matchday; calculated if omitted
             
         Returns:
             Dictionary with team results for this matchday
@@ -124,10 +150,11 @@ class ProbabilisticSeason:
         if matchday > 38 or matchday < 1:
             raise ValueError("Matchday must be between 1 and 38")
         
-        team_scores = {}
-        for team in self.teams:
-            score = team.calculate_total_score(matchday, self.defense_modifier)
-            team_scores[team.name] = score
+        if team_scores is None:
+            team_scores = {}
+            for team in self.teams:
+                score = team.calculate_total_score(matchday, self.defense_modifier)
+                team_scores[team.name] = score
         
         matchday_results = {}
         
@@ -191,9 +218,17 @@ class ProbabilisticSeason:
         """
         print(f"Starting probabilistic processing of {self.name}...")
         
-        for matchday in range(1, 39):
-            print(f"Processing matchday {matchday}...")
-            self.process_matchday(matchday)
+        # Score every team for the whole season up front, one matrix per role
+        matchdays = list(range(1, 39))
+        season_scores = [team.calculate_season_scores(matchdays, self.defense_modifier) for team in self.teams]
+        
+        progress = ProgressLine()
+        for matchday in matchdays:
+            progress.update(f"Processing matchday {matchday}/{len(matchdays)}...")
+            team_scores = {team.name: scores[matchday] for team, scores in zip(self.teams, season_scores)}
+            self.process_matchday(matchday, team_scores)
+        
+        progress.finish()
         
         self.season_completed = True
         print("Probabilistic season completed!")
@@ -222,20 +257,24 @@ class ProbabilisticSeason:
         """
         table = self.get_season_table()
         
-        output = f"\n=== {self.name} - Final Leaderboard ===\n"
-        output += "Pos | Team              | Matchdays | League Pts | Avg League | Avg Fantasy | Best Fantasy\n"
-        output += "-" * 95 + "\n"
+        lines = [
+            f"\n=== {self.name} - Final Leaderboard ===\n",
+            "Pos | Team              | Matchdays | League Pts | Avg League | Avg Fantasy | Best Fantasy\n",
+            "-" * 95 + "\n"
+        ]
         
         for team_data in table:
-            output += f"{team_data['position']:2d}  | "
-            output += f"{team_data['team']:<17} | "
-            output += f"{team_data['matchdays_played']:8d} | "
-            output += f"{team_data['total_league_points']:9.2f} | "
-            output += f"{team_data['average_league_points']:9.2f} | "
-            output += f"{team_data['average_fantasy_score']:10.1f} | "
-            output += f"{team_data['best_fantasy_score']:11.1f}\n"
-        
-        return output
+            lines.append(
+                f"{team_data['position']:2d}  | "
+                f"{team_data['team']:<17} | "
+                f"{team_data['matchdays_played']:8d} | "
+                f"{team_data['total_league_points']:9.2f} | "
+                f"{team_data['average_league_points']:9.2f} | "
+                f"{team_data['average_fantasy_score']:10.1f} | "
+                f"{team_data['best_fantasy_score']:11.1f}\n"
+            )
+        
+        return "".join(lines)
     
     def get_matchday_details(self, matchday: int) -> str:
         """
@@ -249,9 +288,9 @@ class ProbabilisticSeason:
         
         results = []
         for team_name, season_table in self.table.items():
-            if matchday in season_table.matchday_league_points:
-                fantasy_score = season_table.matchday_scores[matchday]
-                league_points = season_table.matchday_league_points[matchday]
+            if season_table.played_mask[matchday]:
+                fantasy_score = season_table.matchday_scores[matchday].item()
+                league_points = season_table.matchday_league_points[matchday].item()
                 results.append((team_name, fantasy_score, league_points))
         
         if not results:
@@ -259,15 +298,17 @@ class ProbabilisticSeason:
         
         results.sort(key=lambda x: x[2], reverse=True)  # Sort by league points
         
-        output = f"\n=== Probabilistic Results for Matchday {matchday} ===\n"
-        output += "Pos | Team              | Fantasy Score | League Points | Win Rate\n"
-        output += "-" * 70 + "\n"
+        lines = [
+            f"\n=== Probabilistic Results for Matchday {matchday} ===\n",
+            "Pos | Team              | Fantasy Score | League Points | Win Rate\n",
+            "-" * 70 + "\n"
+        ]
         
         for i, (team_name, fantasy_score, league_points) in enumerate(results, 1):
             win_rate = (league_points / 3.0) if league_points > 0 else 0.0
-            output += f"{i:2d}  | {team_name:<17} | {fantasy_score:11.1f} | {league_points:11.2f} | {win_rate:7.1%}\n"
+            lines.append(f"{i:2d}  | {team_name:<17} | {fantasy_score:11.1f} | {league_points:11.2f} | {win_rate:7.1%}\n")
         
-        return output
+        return "".join(lines)
     
     def get_season_summary(self) -> Dict:
         """
@@ -275,24 +316,32 @@ class ProbabilisticSeason:
         """
         final_table = self.get_season_table()
         
-        all_fantasy_scores = []
-        all_league_points = []
+        total_matchdays = 0
+        total_fantasy_score = 0.0
+        total_league_points = 0.0
         for season_table in self.table.values():
-            all_fantasy_scores.extend(season_table.matchday_scores.values())
-            all_league_points.extend(season_table.matchday_league_points.values())
-        
-        total_matchdays = sum(st.matchdays_played for st in self.table.values())
-        
-        highest_fantasy_team = max(final_table, key=lambda x: x['best_fantasy_score'])
-        most_consistent_team = min(final_table, key=lambda x: x['best_fantasy_score'] - x['worst_fantasy_score'])
+            total_matchdays += season_table.matchdays_played
+            total_fantasy_score += season_table.total_fantasy_score
+            total_league_points += season_table.total_points
+        
+        highest_fantasy_team = None
+        most_consistent_team = None
+        smallest_range = None
+        for team_data in final_table:
+            if highest_fantasy_team is None or team_data['best_fantasy_score'] > highest_fantasy_team['best_fantasy_score']:
+                highest_fantasy_team = team_data
+            score_range = team_data['best_fantasy_score'] - team_data['worst_fantasy_score']
+            if smallest_range is None or score_range < smallest_range:
+                most_consistent_team = team_data
+                smallest_range = score_range
         
         return {
             'season_name': self.name,
             'season_type': 'Probabilistic',
             'teams': len(self.teams),
             'total_matchdays_processed': total_matchdays,
-            'average_fantasy_score': round(sum(all_fantasy_scores) / len(all_fantasy_scores), 1) if all_fantasy_scores else 0,
-            'average_league_points': round(sum(all_league_points) / len(all_league_points), 2) if all_league_points else 0,
+            'average_fantasy_score': round(total_fantasy_score / total_matchdays, 1) if total_matchdays else 0,
+            'average_league_points': round(total_league_points / total_matchdays, 2) if total_matchdays else 0,
             'final_table': final_table,
             'champion': final_table[0]['team'] if final_table else None,
             'champion_points': final_table[0]['total_league_points'] if final_table else 0,
@@ -310,25 +359,32 @@ class ProbabilisticSeason:
             return {}
         
         season_table = self.table[team_name]
-        progression = []
-        cumulative_points = 0
-        
-        for matchday in range(1, 39):
-            if matchday in season_table.matchday_league_points:
-                fantasy_score = season_table.matchday_scores[matchday]
-                league_points = season_table.matchday_league_points[matchday]
-                cumulative_points += league_points
-                progression.append({
-                    'matchday': matchday,
-                    'fantasy_score': fantasy_score,
-                    'league_points': league_points,
-                    'cumulative_points': round(cumulative_points, 2)
-                })
+        
+        # Only processed matchdays are visited, in matchday order
+        matchdays = np.flatnonzero(season_table.played_mask)
+        league_points = season_table.matchday_league_points[matchdays]
+        cumulative = np.cumsum(league_points)
+        
+        progression = [
+            {
+                'matchday': matchday,
+                'fantasy_score': fantasy_score,
+                'league_points': points,
+                'cumulative_points': round(cumulative_points, 2)
+            }
+            for matchday, fantasy_score, points, cumulative_points in zip(
+                matchdays.tolist(),
+                season_table.matchday_scores[matchdays].tolist(),
+                league_points.tolist(),
+                cumulative.tolist()
+            )
+        ]
+        final_total = cumulative[-1].item() if len(cumulative) else 0
         
         return {
             'team': team_name,
             'progression': progression,
-            'final_total': cumulative_points
+            'final_total': final_total
         }
     
     def __str__(self):
@@ -0,0 +1,21 @@
+import sys
+
+class ProgressLine:
+    """
+    This class shows a progress message redrawn on one terminal line.
+    Nothing is printed when the output is redirected, so logs only get the final messages.
+    """
+    __slots__ = ('enabled',)
+
+    def __init__(self):
+        self.enabled = sys.stdout.isatty()
+
+    def update(self, message: str):
+        """Replace the current progress message"""
+        if self.enabled:
+            print(f"\r{message}", end="", flush=True)
+
+    def finish(self):
+        """Move past the progress line"""
+        if self.enabled:
+            print()
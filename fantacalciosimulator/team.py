@@ -1,4 +1,5 @@
 from typing import List, Dict
+import numpy as np
 from .player import Player
 from .role import Role
 
@@ -145,6 +146,48 @@ class Team:
         self.total_scores[matchday] = total_score
         return total_score
     
+    def calculate_season_scores(self, matchdays: List[int], defense_modifier: bool = True) -> Dict[int, float]:
+        """
+        Select lineups and calculate total team scores for several matchdays at once.
+        Gives the same lineups and scores as calling calculate_total_score for each matchday.
+        
+        Args:
+            matchdays: The matchday numbers (1-38)
+            defense_modifier: Whether to apply defense modifier bonus (default: True)
+            
+        Returns:
+            Dictionary mapping each matchday to the total team score
+        """
+        formation = [(Role.GOALKEEPER, 1), (Role.DEFENDER, 4), (Role.MIDFIELDER, 3), (Role.FORWARD, 3)]
+        lineups = [[] for _ in matchdays]
+        selected = []
+        
+        for role, count in formation:
+            players = self.get_players_by_role(role)
+            if not players:
+                continue
+            
+            # players x matchdays matrix; a stable sort of the negated values keeps
+            # squad order on ties, like list.sort(reverse=True) in select_lineup
+            fantavoti = np.array([[p.matchday_fantavoto.get(m, 0) for m in matchdays] for p in players], dtype=float)
+            order = np.argsort(-fantavoti, axis=0, kind='stable')[:count]
+            selected.append(np.take_along_axis(fantavoti, order, axis=0))
+            
+            for lineup, rows in zip(lineups, order.T.tolist()):
+                lineup.extend(players[i] for i in rows)
+        
+        totals = np.concatenate(selected).sum(axis=0) if selected else np.zeros(len(matchdays))
+        
+        scores = {}
+        for matchday, lineup, total_score in zip(matchdays, lineups, totals.tolist()):
+            self.lineup[matchday] = lineup
+            if defense_modifier:
+                total_score += self.calculate_defense_modifier(matchday)
+            self.total_scores[matchday] = total_score
+            scores[matchday] = total_score
+        
+        return scores
+    
     def get_lineup_summary(self, matchday: int, defense_modifier: bool = True) -> str:
         """
         Get a formatted summary of the lineup for a matchday
@@ -157,7 +200,7 @@ class Team:
         if matchday not in self.lineup:
             return "No lineup selected for this matchday"
         
-        summary = f"\n=== {self.name} - Matchday {matchday} ===\n"
+        lines = [f"\n=== {self.name} - Matchday {matchday} ===\n"]
 
         lineup_by_role = {
             Role.GOALKEEPER: [],
@@ -171,21 +214,21 @@ class Team:
 
         for role, players in lineup_by_role.items():
             if players:
-                summary += f"\n{role.value}:\n"
+                lines.append(f"\n{role.value}:\n")
                 for player in players:
                     fantavoto = player.matchday_fantavoto.get(matchday, 0)
-                    summary += f"  {player.name} ({player.real_team}): {fantavoto}\n"
+                    lines.append(f"  {player.name} ({player.real_team}): {fantavoto}\n")
         
         if defense_modifier:
             defense_bonus = self.calculate_defense_modifier(matchday)
-            summary += f"\nDefense Modifier: +{defense_bonus}"
+            lines.append(f"\nDefense Modifier: +{defense_bonus}")
         else:
-            summary += f"\nDefense Modifier: Disabled"
+            lines.append(f"\nDefense Modifier: Disabled")
         
         total_score = self.total_scores.get(matchday, 0)
-        summary += f"\nTotal Score: {total_score}\n"
+        lines.append(f"\nTotal Score: {total_score}\n")
         
-        return summary
+        return "".join(lines)
     
     def get_team_stats(self) -> Dict:
         """